@@ -1,5 +1,6 @@
 import random
-from object_detection.fingers2 import process_image
+from object_detection.fingers2 import process_images
+from object_detection.utils import shutdown_image_writes
 import os
 from tqdm import tqdm  # import tqdm
 import csv
@@ -23,12 +24,14 @@ if __name__ == "__main__":
     image_names = [img for img in os.listdir(DIR_PATH) if img.endswith(('.jpg', '.jpeg', '.png'))]
     pip_features = []
     dip_features = []
-    for image_name in tqdm(image_names, desc="Processing images"):
-        image_path = os.path.join(DIR_PATH, image_name)
-        pip_feature, dip_feature = process_image(image_path, MASK_OUTPUT_DIR, FINGER_OUTPUT_DIR, NAIL_OUTPUT_DIR)
+    image_paths = [os.path.join(DIR_PATH, image_name) for image_name in image_names]
+    for pip_feature, dip_feature in tqdm(process_images(image_paths, MASK_OUTPUT_DIR, FINGER_OUTPUT_DIR, NAIL_OUTPUT_DIR),
+                                         total=len(image_paths), desc="Processing images"):
         pip_features.append(pip_feature)
         dip_features.append(dip_feature)
 
+    # Make sure every output image has been written before exiting
+    shutdown_image_writes()
 
     output_csv_path = "results/features_pip_swollen.csv"
     with open(output_csv_path, 'w', newline='') as csvfile:
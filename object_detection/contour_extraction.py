@@ -1,7 +1,21 @@
 import cv2
 import numpy as np
 
-from object_detection.landmarks_constants import *
+from object_detection.landmarks_constants import THUMB_TIP, INDEX_FINGER_TIP, MIDDLE_FINGER_TIP, RING_FINGER_TIP, PINKY_TIP
+
+# Number of contour points processed at once by the NumPy path of closest_contour_point
+CONTOUR_BLOCK_SIZE = 512
+
+# Sentinel squared distance for contour points that are not candidates, distances are kept in int32
+_MAX_DISTANCE = np.iinfo(np.int32).max
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
 def extract_contour(image: np.ndarray) -> np.ndarray:
     """
     Extracts the largest contour from a binary image.
@@ -32,18 +46,75 @@ def extract_contour(image: np.ndarray) -> np.ndarray:
     if not contours:
         return
 
-    # Sort the contours by area in descending order
-    contours = sorted(contours, key=cv2.contourArea, reverse=True)
-    
-    # Return the largest contour by area
-    return np.squeeze(contours[0])
+    # Return the largest contour by area as an (N, 2) array
+    return max(contours, key=cv2.contourArea).reshape(-1, 2).astype(np.int32, copy=False)
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True, fastmath=True)
+    def _closest_pairs(landmarks: np.ndarray, contour: np.ndarray, is_tip: np.ndarray) -> np.ndarray:
+        """
+        Finds the closest left and right contour points of each landmark in a single pass over the contour.
+
+        Args:
+            landmarks (np.ndarray): An (N, 2) array of landmark pixel coordinates.
+            contour (np.ndarray): An (C, 2) array of contour points.
+            is_tip (np.ndarray): An (N,) boolean array marking the fingertip landmarks.
+
+        Returns:
+            np.ndarray: An (N, 2, 2) array with the closest left and right contour point of each landmark.
+        """
+        out = np.empty((landmarks.shape[0], 2, 2), dtype=contour.dtype)
+        for i in range(landmarks.shape[0]):
+            lx, ly = landmarks[i, 0], landmarks[i, 1]
+            best_left = best_right = best_any = _MAX_DISTANCE
+            left_idx = right_idx = any_idx = -1
+            for j in range(contour.shape[0]):
+                cx, cy = contour[j, 0], contour[j, 1]
+                d = (cx - lx) * (cx - lx) + (cy - ly) * (cy - ly)
+                if d < best_any:
+                    best_any = d
+                    any_idx = j
+                # For the fingertips only consider the contour points below the landmark
+                if is_tip[i] and cy < ly:
+                    continue
+                if cx <= lx:
+                    if d < best_left:
+                        best_left = d
+                        left_idx = j
+                elif d < best_right:
+                    best_right = d
+                    right_idx = j
+
+            # For empty contours (when landmarks are on extreme left or right), use the entire contour
+            out[i, 0] = contour[left_idx if left_idx >= 0 else any_idx]
+            out[i, 1] = contour[right_idx if right_idx >= 0 else any_idx]
+        return out
+
+
+def _update_closest(distances: np.ndarray, offset: int, best: np.ndarray, best_indices: np.ndarray):
+    """
+    Updates the running minimum distance and contour index of each landmark with a block of distances.
+
+    Args:
+        distances (np.ndarray): An (N, block) array of distances between the landmarks and a block of contour points.
+        offset (int): The index of the first contour point of the block.
+        best (np.ndarray): The (N,) running minimum distances, updated in place.
+        best_indices (np.ndarray): The (N,) contour indices of the running minimum distances, updated in place.
+    """
+    block_indices = distances.argmin(axis=1)
+    block_best = distances[np.arange(len(distances)), block_indices]
+    better = block_best < best
+    best[better] = block_best[better]
+    best_indices[better] = block_indices[better] + offset
+
 
-def closest_contour_point(landmarks: list, contour: np.ndarray) -> list:
+def closest_contour_point(landmarks: np.ndarray, contour: np.ndarray) -> list:
     """
     Finds the closest points on a contour to each given landmark.
 
     Args:
-        landmarks (list): A list of landmarks, where each landmark is a tuple (x, y).
+        landmarks (np.ndarray): An (N, 2) array of landmarks, where each row is a pixel coordinate (x, y).
         contour (np.ndarray): The contour to which the closest points are to be found.
 
     Returns:
@@ -59,36 +130,50 @@ def closest_contour_point(landmarks: list, contour: np.ndarray) -> list:
         True
     """
 
-    closest_points = []
-
-    for ctr, landmark in enumerate(landmarks):
-        if ctr in [THUMB_TIP, INDEX_FINGER_TIP, MIDDLE_FINGER_TIP, RING_FINGER_TIP, PINKY_TIP]:
-            left_contour = contour[(contour[:, 0] <= landmark[0]) & (contour[:, 1] >= landmark[1])]
-            right_contour = contour[(contour[:, 0] > landmark[0]) & (contour[:, 1] >= landmark[1])]
-        else:
-            left_contour = contour[(contour[:, 0] <= landmark[0])]
-            right_contour = contour[(contour[:, 0] > landmark[0])]
-
-
-        # For empty contours (when landmarks are on extreme left or right), use the entire contour
-        if len(left_contour) == 0:
-            left_contour = contour
-        if len(right_contour) == 0:
-            right_contour = contour
-
-        # Find closest point on the left of the landmark
-        left_distances = np.sqrt(np.sum((left_contour - landmark)**2, axis=1))
-        left_min_index = np.argmin(left_distances)
-        left_closest_point = tuple(left_contour[left_min_index])
-
-        # Find closest point on the right of the landmark
-        right_distances = np.sqrt(np.sum((right_contour - landmark)**2, axis=1))
-        right_min_index = np.argmin(right_distances)
-        right_closest_point = tuple(right_contour[right_min_index])
-
-        closest_points.append((left_closest_point, right_closest_point))
-
-    return closest_points
+    landmarks = np.asarray(landmarks, dtype=np.int32).reshape(-1, 2)
+    contour = np.asarray(contour, dtype=np.int32).reshape(-1, 2)
+    tips = (THUMB_TIP, INDEX_FINGER_TIP, MIDDLE_FINGER_TIP, RING_FINGER_TIP, PINKY_TIP)
+    is_tip = np.zeros(len(landmarks), dtype=np.bool_)
+    is_tip[[tip for tip in tips if tip < len(landmarks)]] = True
+
+    if HAS_NUMBA:
+        # Loop over the contour in compiled code and avoid the (L, C) temporaries
+        pairs = _closest_pairs(landmarks, np.ascontiguousarray(contour), is_tip)
+        return list(zip(pairs[:, 0], pairs[:, 1]))
+
+    # Keep the contour as separate contiguous x and y arrays and walk it in blocks,
+    # so the (L, block) temporaries stay in cache while the landmarks are reused.
+    contour_x = np.ascontiguousarray(contour[:, 0])
+    contour_y = np.ascontiguousarray(contour[:, 1])
+    landmarks_x = landmarks[:, 0, None]
+    landmarks_y = landmarks[:, 1, None]
+    not_tip = ~is_tip[:, None]
+
+    best_left, best_right, best_any = (np.full(len(landmarks), _MAX_DISTANCE, dtype=np.int32) for _ in range(3))
+    left_indices, right_indices, any_indices = (np.zeros(len(landmarks), dtype=np.intp) for _ in range(3))
+    for offset in range(0, len(contour), CONTOUR_BLOCK_SIZE):
+        block_x = contour_x[offset:offset + CONTOUR_BLOCK_SIZE]
+        block_y = contour_y[offset:offset + CONTOUR_BLOCK_SIZE]
+
+        # Squared distances in int32, the square root does not change the argmin
+        dx = block_x - landmarks_x
+        dy = block_y - landmarks_y
+        distances = dx * dx + dy * dy
+
+        # Split the contour into the points on the left and on the right of each landmark,
+        # and for the fingertips only consider the contour points below the landmark
+        left = block_x <= landmarks_x
+        valid = not_tip | (block_y >= landmarks_y)
+
+        _update_closest(distances, offset, best_any, any_indices)
+        _update_closest(np.where(left & valid, distances, _MAX_DISTANCE), offset, best_left, left_indices)
+        _update_closest(np.where(~left & valid, distances, _MAX_DISTANCE), offset, best_right, right_indices)
+
+    # For empty contours (when landmarks are on extreme left or right), use the entire contour
+    left_indices = np.where(best_left == _MAX_DISTANCE, any_indices, left_indices)
+    right_indices = np.where(best_right == _MAX_DISTANCE, any_indices, right_indices)
+
+    return list(zip(contour[left_indices], contour[right_indices]))
 
 
 def get_left_and_right_contour_points(landmark: tuple, contour: np.ndarray) -> tuple:
@@ -1,22 +1,23 @@
 import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
 import numpy as np
-from mediapipe.tasks import python
-from mediapipe.tasks.python import vision
-import mediapipe as mp
-from object_detection.contour_extraction import closest_contour_point, create_finger_contour, extract_contour, get_left_and_right_contour_points, reorient_contour
-from object_detection.landmarks import adjust_for_roi_crop, find_object_width_at_row, landmarks_to_pixel_coordinates, transform_point
-from object_detection.roi_extraction import extract_roi, get_bounding_box_from_points,  get_bounding_box_from_center
+from object_detection.contour_extraction import closest_contour_point, extract_contour
+from object_detection.landmarks import find_object_width_at_row, landmarks_to_pixel_coordinates, transform_points
+from object_detection.roi_extraction import extract_roi, get_bounding_box_from_points
 from object_detection.segmentation import get_segmentation_mask
-from .landmarks_constants import *
-from .pixel_finder import landmark_to_pixels
-from .utils import locate_hand_landmarks, draw_landmarks_on_image, resize_image, save_roi_image
-import subprocess
+from .landmarks_constants import finger_neighbors, landmarks_per_finger
+from .utils import get_landmarker, locate_hand_landmarks, resize_longest_edge_to_target, save_roi_image, wait_for_pending_writes, write_image_async
 import segmentation
 from shapely.geometry import Polygon
-from random import randint
+
+# Longest edge, in pixels, of the image used for background removal and contour extraction
+SEGMENTATION_SIZE = 512
+
+# The per-finger pipelines are independent and spend most of their time in OpenCV calls that release the GIL
+_FINGER_POOL = ThreadPoolExecutor(max_workers=4)
 
 def rect_to_polygon(rect):
     """
@@ -114,7 +115,7 @@ def get_rotated_image_shape(image_shape, rotation_matrix):
         finger_key (str): The key identifying the finger.
         landmarks_per_finger (dict): A dictionary mapping fingers to their respective landmarks.
         closest_points (list): A list of closest contour points for each landmark.
-        landmark_pixels (list): Pixel coordinates of the landmarks.
+        landmark_pixels (np.ndarray): Pixel coordinates of the landmarks.
         rgb_mask (np.ndarray): The RGB mask of the image.
         PATH (str): The file path of the input image.
         FINGER_OUTPUT_DIR (str): The directory where output images are saved.
@@ -146,7 +147,7 @@ def get_rotated_image_shape(image_shape, rotation_matrix):
 
     return new_height, new_width
 
-def process_finger(finger_key, landmarks_per_finger, closest_points, landmark_pixels, rgb_mask, image, PATH, FINGER_OUTPUT_DIR, NAIL_OUTPUT_DIR):
+def process_finger(finger_key, landmarks_per_finger, closest_points, landmark_pixels, seg_mask, image, PATH, FINGER_OUTPUT_DIR, NAIL_OUTPUT_DIR):
     """
     Processes a finger to compute measurements and adjust images.
 
@@ -154,8 +155,8 @@ def process_finger(finger_key, landmarks_per_finger, closest_points, landmark_pi
         finger_key (str): The key identifying the finger.
         landmarks_per_finger (dict): A dictionary mapping fingers to their respective landmarks.
         closest_points (list): A list of closest contour points for each landmark.
-        landmark_pixels (list): Pixel coordinates of the landmarks.
-        rgb_mask (np.ndarray): The RGB mask of the image.
+        landmark_pixels (np.ndarray): Pixel coordinates of the landmarks.
+        seg_mask (np.ndarray): The single-channel segmentation mask of the image.
         PATH (str): The file path of the input image.
         FINGER_OUTPUT_DIR (str): The directory where output images are saved.
 
@@ -168,18 +169,15 @@ def process_finger(finger_key, landmarks_per_finger, closest_points, landmark_pi
     finger_roi_points = [item for idx in landmarks_per_finger[finger_key][1:] for item in closest_points[idx]]
     finger_roi_points.append(landmark_pixels[landmarks_per_finger[finger_key][0]])
 
-    rect = get_bounding_box_from_points(rgb_mask, finger_roi_points)
-    roi, rotation_matrix = extract_roi(rgb_mask, rect)
-    pip = np.array(landmark_pixels[landmarks_per_finger[finger_key][1]])
-    dip = np.array(landmark_pixels[landmarks_per_finger[finger_key][2]])
-
-    # Rotate the landmarks
-    rotated_pip = transform_point(pip, rotation_matrix)
-    rotated_dip = transform_point(dip, rotation_matrix)
+    rect = get_bounding_box_from_points(seg_mask, finger_roi_points)
+    roi, rotation_matrix = extract_roi(seg_mask, rect)
+    if roi.size == 0:
+        # Skip the finger, its vertical distance is left out of the mean
+        print(f"Warning: The ROI of finger {finger_key} is empty. Skipping it for {os.path.basename(PATH)}.")
+        return 0, 0, np.nan
 
-    # Map the landmarks to the resized image
-    new_pip = adjust_for_roi_crop(rotated_pip, rect[0], rect[1])
-    new_dip = adjust_for_roi_crop(rotated_dip, rect[0], rect[1])
+    # Map the PIP and DIP landmarks into the ROI
+    new_pip, new_dip = transform_points(landmark_pixels[landmarks_per_finger[finger_key][1:3]], rotation_matrix)
 
     # Compute pixel width of object at the row of new_pip
     pip_width = find_object_width_at_row(roi, new_pip[1], new_pip[0])
@@ -188,24 +186,21 @@ def process_finger(finger_key, landmarks_per_finger, closest_points, landmark_pi
     dip_width = find_object_width_at_row(roi, new_dip[1], new_dip[0])
 
     vertical_distance = abs(new_dip[1] - new_pip[1])
+    # Convert only the small ROI to BGR so the landmarks can be drawn in color
+    roi = cv2.cvtColor(roi, cv2.COLOR_GRAY2BGR)
     # Draw the landmarks on the image, blue for pip, red for dip
     cv2.circle(roi, tuple(new_pip), 5, (255, 0, 0), -1)
     cv2.circle(roi, tuple(new_dip), 5, (0, 0, 255), -1)
 
+    # The rectangle in ROI coordinates
+    roi_rect = ((roi.shape[1] / 2, roi.shape[0] / 2), rect[1], rect[2])
     neighbors = finger_neighbors[finger_key]
     for neighbor_key in neighbors:
-        neighbor_pip = np.array(landmark_pixels[landmarks_per_finger[neighbor_key][1]])
-        neighbor_dip = np.array(landmark_pixels[landmarks_per_finger[neighbor_key][2]])
-        
-        # Rotate the landmarks
-        rotated_neighbor_pip = transform_point(neighbor_pip, rotation_matrix)
-        rotated_neighbor_dip = transform_point(neighbor_dip, rotation_matrix)
-
-        if is_inside_rotated_rect(rotated_neighbor_dip, rect) and is_inside_rotated_rect(rotated_neighbor_pip, rect):
-            
-            # Map the landmarks to the resized image
-            transformed_neighbor_pip = adjust_for_roi_crop(rotated_neighbor_pip, rect[0], rect[1])
-            transformed_neighbor_dip = adjust_for_roi_crop(rotated_neighbor_dip, rect[0], rect[1])
+        # Map the neighbor PIP and DIP landmarks into the ROI
+        transformed_neighbor_pip, transformed_neighbor_dip = transform_points(
+            landmark_pixels[landmarks_per_finger[neighbor_key][1:3]], rotation_matrix)
+
+        if is_inside_rotated_rect(transformed_neighbor_dip, roi_rect) and is_inside_rotated_rect(transformed_neighbor_pip, roi_rect):
             
             # Draw neighbor landmarks on the image, cyan for pip and magenta for dip
             cv2.circle(roi, tuple(transformed_neighbor_pip), 5, (255, 255, 0), -1)
@@ -236,10 +231,8 @@ def process_finger(finger_key, landmarks_per_finger, closest_points, landmark_pi
             rotated_image_roi = cv2.warpAffine(image_roi, new_rotation_matrix, (new_width, new_height))
 
             # Rotate the transformed landmarks
-            rotated_pip = transform_point(new_pip, new_rotation_matrix)
-            rotated_dip = transform_point(new_dip, new_rotation_matrix)
-            rotated_neighbor_pip = transform_point(transformed_neighbor_pip, new_rotation_matrix)
-            rotated_neighbor_dip = transform_point(transformed_neighbor_dip, new_rotation_matrix)
+            rotated_pip, rotated_dip, rotated_neighbor_pip, rotated_neighbor_dip = transform_points(
+                [new_pip, new_dip, transformed_neighbor_pip, transformed_neighbor_dip], new_rotation_matrix)
 
             # Calculate new mid points
             pip_middle = ((rotated_pip[0] + rotated_neighbor_pip[0]) // 2, (rotated_pip[1] + rotated_neighbor_pip[1]) //2)
@@ -292,36 +285,87 @@ def process_image(PATH, MASKS_OUTPUT_DIR, FINGER_OUTPUT_DIR, NAIL_OUTPUT_DIR):
         return [0, 0, 0, 0], [0, 0, 0, 0]
 
     landmark_pixels = landmarks_to_pixel_coordinates(image, landmarks)
-    enhanced_image = image
-    padding = 250
-    
+
+    # Run the background removal and contour extraction on a downscaled copy of the image
+    small_image = image
+    if max(image.shape[:2]) > SEGMENTATION_SIZE:
+        small_image = resize_longest_edge_to_target(image, SEGMENTATION_SIZE)
+    # Per-axis (x, y) scale, since both axes are truncated independently when resizing
+    scale = np.array([image.shape[1] / small_image.shape[1], image.shape[0] / small_image.shape[0]])
+    enhanced_image = small_image
+
     try:
         result = segmentation.bg.remove(data=enhanced_image)
     except ValueError as e:
         print(f"Caught a value error: {e} on image {os.path.basename(PATH)}")
         return [0, 0, 0, 0], [0, 0, 0, 0]
-        
-    result = cv2.copyMakeBorder(result, padding, padding, padding, padding, cv2.BORDER_CONSTANT, value=0)
-    image = cv2.copyMakeBorder(image, padding, padding, padding, padding, cv2.BORDER_CONSTANT, value=0)
-    landmark_pixels = [(x+padding, y+padding) for x, y in landmark_pixels]
-    
-    seg_mask = get_segmentation_mask(result)
+
+    small_mask = get_segmentation_mask(result)
+
+    # Upscale the mask back to the original resolution for the ROI extraction
+    seg_mask = cv2.resize(small_mask, (image.shape[1], image.shape[0]), interpolation=cv2.INTER_LINEAR)
+    _, seg_mask = cv2.threshold(seg_mask, 127, 255, cv2.THRESH_BINARY)
     OUTPUT_PATH_MASK = os.path.join(MASKS_OUTPUT_DIR, "seg_" + os.path.basename(PATH))
-    cv2.imwrite(OUTPUT_PATH_MASK, seg_mask)
+    write_image_async(OUTPUT_PATH_MASK, seg_mask)
 
-    contour = extract_contour(seg_mask)
-    if contour is None or len(contour.shape) == 1:
+    contour = extract_contour(small_mask)
+    if contour is None or len(contour) == 1:
         print(f"Warning: The contour is empty. Skipping {os.path.basename(PATH)}.")
         return [0, 0, 0, 0], [0, 0, 0, 0]
 
-    rgb_mask = cv2.cvtColor(seg_mask, cv2.COLOR_GRAY2RGB)
-    closest_points = closest_contour_point(landmark_pixels, contour)
+    # Find the closest contour points on the downscaled mask and map them back to the original resolution
+    closest_points = closest_contour_point(np.rint(landmark_pixels / scale).astype(np.int32), contour)
+    closest_points = [(np.rint(left * scale).astype(int), np.rint(right * scale).astype(int)) for left, right in closest_points]
     pip_widths, dip_widths, vertical_distances = [], [], []
-    for key in ['INDEX', 'MIDDLE', 'RING', 'PINKY']:
-        pip_width, dip_width, vertical_distance = process_finger(key, landmarks_per_finger, closest_points, landmark_pixels, rgb_mask, image, PATH, FINGER_OUTPUT_DIR, NAIL_OUTPUT_DIR)
+    finger_results = _FINGER_POOL.map(
+        lambda key: process_finger(key, landmarks_per_finger, closest_points, landmark_pixels, seg_mask, image, PATH, FINGER_OUTPUT_DIR, NAIL_OUTPUT_DIR),
+        ['INDEX', 'MIDDLE', 'RING', 'PINKY'])
+    for pip_width, dip_width, vertical_distance in finger_results:
         pip_widths.append(pip_width)
         dip_widths.append(dip_width)
+        vertical_distances.append(vertical_distance)
 
-    mean_vertical_distance = np.mean(vertical_distances)
+    mean_vertical_distance = np.nanmean(vertical_distances)
 
     return np.array(pip_widths) / mean_vertical_distance, np.array(dip_widths) / mean_vertical_distance
+
+
+def process_images(PATHS, MASKS_OUTPUT_DIR, FINGER_OUTPUT_DIR, NAIL_OUTPUT_DIR, workers=4):
+    """
+    Processes a batch of images, overlapping the decoding, inference and writing of different images.
+
+    The hand landmarker and the background removal model are loaded once up front, then the images
+    are processed by `process_image` on a pool of worker threads. Results are yielded in input order.
+
+    Args:
+        PATHS (list): The file paths of the input images.
+        MASKS_OUTPUT_DIR (str): The directory where mask output images are saved.
+        FINGER_OUTPUT_DIR (str): The directory where finger-related output images are saved.
+        NAIL_OUTPUT_DIR (str): The directory where nail-related output images are saved.
+        workers (int, optional): The number of images processed concurrently. Defaults to 4.
+
+    Yields:
+        tuple: The arrays of pip and dip width ratios returned by `process_image` for each image.
+
+    Test Case:
+        # Requires specific image files and directory setup for a practical test case.
+    """
+    # Warm up the models so the workers do not each pay the loading cost
+    get_landmarker("hand_landmarker.task")
+    segmentation.bg.get_model("u2net")
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(
+                lambda path: process_image(path, MASKS_OUTPUT_DIR, FINGER_OUTPUT_DIR, NAIL_OUTPUT_DIR), PATHS)
+    except BaseException:
+        # Processing failed or stopped early, flush the queued writes without letting
+        # a write error replace the exception already in flight
+        try:
+            wait_for_pending_writes()
+        except IOError as e:
+            print(f"Warning: {e}")
+        raise
+
+    # Make sure every queued output image has been written
+    wait_for_pending_writes()
@@ -2,20 +2,19 @@ import cv2
 import numpy as np
 
 from object_detection.roi_extraction import extract_roi, get_bounding_box_from_center, get_bounding_box_from_points
-from .pixel_finder import landmark_to_pixels
 from .landmarks_constants import landmarks_per_finger
 
 
-def landmarks_to_pixel_coordinates(image: np.ndarray, landmarks: object) -> list:
+def landmarks_to_pixel_coordinates(image: np.ndarray, landmarks: object) -> np.ndarray:
     """
     Converts hand landmarks into pixel coordinates on the given image.
 
     Args:
-        image (np.ndarray): The image on which the hand landmarks are detected. Should be in BGR format.
+        image (np.ndarray): The image on which the hand landmarks are detected. Only its size is used.
         landmarks (object): An object containing hand landmarks data, typically obtained from a hand tracking model.
 
     Returns:
-        list: A list of tuples, each representing the (x, y) pixel coordinates of a hand landmark.
+        np.ndarray: An (N, 2) int32 array with the (x, y) pixel coordinates of each hand landmark.
 
     Test Case:
         Assume `fake_image` is a numpy array representing an image and `fake_landmarks` is a mock object of landmarks.
@@ -23,67 +22,44 @@ def landmarks_to_pixel_coordinates(image: np.ndarray, landmarks: object) -> list
         >>> fake_landmarks = MockLandmarks()  # a mock landmarks object
         >>> pixels = landmarks_to_pixel_coordinates(fake_image, fake_landmarks)
         >>> type(pixels)
-        <class 'list'>
-        >>> type(pixels[0])
-        <class 'tuple'>
+        <class 'numpy.ndarray'>
+        >>> pixels.shape
+        (21, 2)
     """
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    return [landmark_to_pixels(gray, landmarks.hand_landmarks[0], idx) for idx in
-            range(len(landmarks.hand_landmarks[0]))]
+    height, width = image.shape[:2]
+    hand_landmarks = landmarks.hand_landmarks[0]
+    xs = np.fromiter((landmark.x for landmark in hand_landmarks), np.float32, count=len(hand_landmarks))
+    ys = np.fromiter((landmark.y for landmark in hand_landmarks), np.float32, count=len(hand_landmarks))
 
+    return np.stack([np.clip(np.rint(xs * width).astype(np.int32), 0, width - 1),
+                     np.clip(np.rint(ys * height).astype(np.int32), 0, height - 1)], axis=1)
 
-def transform_point(point: tuple, matrix: np.ndarray) -> tuple:
+
+def transform_points(points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
     """
-    Applies an affine transformation to a point using the given transformation matrix.
+    Applies an affine transformation to a batch of points using the given transformation matrix.
 
     Args:
-        point (tuple): The (x, y) coordinates of the point to be transformed.
-        matrix (np.ndarray): The 3x3 affine transformation matrix.
+        points (np.ndarray): An (N, 2) array of (x, y) coordinates of the points to be transformed.
+        matrix (np.ndarray): The 2x3 (or 3x3) affine transformation matrix.
 
     Returns:
-        tuple: The transformed (x, y) coordinates.
+        np.ndarray: An (N, 2) integer array with the transformed (x, y) coordinates.
 
     Test Case:
-        >>> point = (10, 20)
-        >>> matrix = np.array([[1, 0, 5], [0, 1, 10], [0, 0, 1]])
-        >>> transform_point(point, matrix)
-        (15, 30)
+        >>> points = np.array([[10, 20], [30, 40]])
+        >>> matrix = np.array([[1, 0, 5], [0, 1, 10]], dtype=np.float64)
+        >>> transform_points(points, matrix)
+        array([[15, 30],
+               [35, 50]])
     """
-    # Convert point to homogeneous coordinates
-    homogeneous_point = np.array([[point[0]], [point[1]], [1]])
-    
-    # Apply affine transformation
-    transformed_point = np.squeeze(np.dot(matrix, homogeneous_point))
-    
-    # Return the transformed point in (x, y) format
-    return (int(transformed_point[0]), int(transformed_point[1]))
-
+    points = np.asarray(points, dtype=np.float32).reshape(1, -1, 2)
 
-def adjust_for_roi_crop(point: tuple, roi_center: tuple, roi_size: tuple) -> np.ndarray:
-    """
-    Adjusts a point's coordinates based on the region of interest (ROI) cropping.
-
-    Args:
-        point (tuple): The (x, y) coordinates of the point.
-        roi_center (tuple): The center (x, y) of the ROI.
-        roi_size (tuple): The size (width, height) of the ROI.
+    # Apply the affine transformation to all points at once
+    transformed_points = cv2.transform(points, np.asarray(matrix, dtype=np.float64))
 
-    Returns:
-        np.ndarray: The adjusted coordinates of the point as a numpy array.
-
-    Test Case:
-        >>> point = (150, 200)
-        >>> roi_center = (100, 100)
-        >>> roi_size = (50, 50)
-        >>> adjust_for_roi_crop(point, roi_center, roi_size)
-        array([100, 150])
-    """
-    x_offset = int(roi_center[0] - roi_size[0] // 2)
-    y_offset = int(roi_center[1] - roi_size[1] // 2)
-    
-    adjusted_x = point[0] - x_offset
-    adjusted_y = point[1] - y_offset
-    return np.array([adjusted_x, adjusted_y])
+    # Return the transformed points in (x, y) format
+    return transformed_points[0, :, :2].astype(int)
 
 
 def find_object_width_at_row(image: np.ndarray, row: int, col: int) -> int:
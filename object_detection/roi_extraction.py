@@ -67,14 +67,15 @@ def extract_roi(image: np.ndarray, rect: tuple) -> tuple[np.ndarray, np.ndarray]
         rect (tuple): A tuple describing the rotated rectangle (center, (width, height), angle).
 
     Returns:
-        tuple: A tuple containing the ROI as an image and the rotation matrix used for the extraction.
+        tuple: A tuple containing the ROI as an image and the affine matrix mapping image coordinates to ROI coordinates.
+        The ROI is empty, with shape (0, 0), when the rectangle has a zero width or height.
 
     Test Case:
         >>> image = np.zeros((100, 100, 3), dtype=np.uint8)
         >>> rect = ((50, 50), (40, 20), 45)
         >>> roi, rotation_matrix = extract_roi(image, rect)
         >>> roi.shape  # Outputs may vary based on rect dimensions
-        (23, 43, 3)
+        (23, 46, 3)
     """
     # Scale up the width and height by 15% for a margin.
     center, size, theta = rect
@@ -84,10 +85,15 @@ def extract_roi(image: np.ndarray, rect: tuple) -> tuple[np.ndarray, np.ndarray]
     # Obtain the rotation matrix
     rotation_matrix = cv2.getRotationMatrix2D(center, theta, 1)
 
-    # Perform the affine transformation on the padded image
-    warped_image = cv2.warpAffine(image, rotation_matrix, (image.shape[1], image.shape[0]), borderValue=(0, 0, 0))
+    # Translate the rotated ROI to the origin so only the ROI itself is resampled
+    x, y = int(center[0] - width // 2), int(center[1] - height // 2)
+    rotation_matrix[0, 2] -= x
+    rotation_matrix[1, 2] -= y
+
+    # A degenerate rectangle gives an empty ROI, warpAffine would treat a zero size as the source size
+    if int(width) == 0 or int(height) == 0:
+        return np.zeros((0, 0) + image.shape[2:], dtype=image.dtype), rotation_matrix
 
     # Extract the ROI
-    x, y = int(center[0] - width // 2), int(center[1] - height // 2)
-    roi = warped_image[y:y + int(height), x:x + int(width)]
+    roi = cv2.warpAffine(image, rotation_matrix, (int(width), int(height)), borderValue=(0, 0, 0))
     return roi, rotation_matrix
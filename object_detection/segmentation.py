@@ -7,16 +7,17 @@ def get_segmentation_mask(image: np.ndarray, threshold: int = 11) -> np.ndarray:
 
     This function converts an RGB image to grayscale and then creates a binary mask
     where pixels above a certain threshold are marked as foreground (255) and the rest as background (0).
+    For RGBA images the alpha channel already holds the mask, so it is thresholded directly.
 
     Args:
-        image (np.ndarray): The RGB image from which to generate the mask.
-        threshold (int, optional): The grayscale threshold for foreground-background segmentation. Defaults to 11.
+        image (np.ndarray): The RGB or RGBA image from which to generate the mask.
+        threshold (int, optional): The grayscale (or alpha) threshold for foreground-background segmentation. Defaults to 11.
 
     Returns:
         np.ndarray: A binary mask of the same size as the input image.
 
     Raises:
-        ValueError: If the input image is not a 3-channel RGB image.
+        ValueError: If the input image is not a 3-channel RGB or 4-channel RGBA image.
 
     Test Case:
         >>> image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
@@ -26,14 +27,18 @@ def get_segmentation_mask(image: np.ndarray, threshold: int = 11) -> np.ndarray:
         >>> np.unique(mask)
         array([  0, 255], dtype=uint8)  # Only two values should be present in the mask: 0 and 255
     """
-# Check if the image has three channels
-    if len(image.shape) != 3 or image.shape[2] != 3:
-        raise ValueError("Expected an RGB image with 3 channels. Received image with shape {}.".format(image.shape))
+# Check if the image has three or four channels
+    if len(image.shape) != 3 or image.shape[2] not in (3, 4):
+        raise ValueError("Expected an RGB image with 3 channels or an RGBA image with 4 channels. Received image with shape {}.".format(image.shape))
 
-    # Convert the image to grayscale
-    grayscale_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    if image.shape[2] == 4:
+        # Use the alpha channel as the grayscale image
+        grayscale_image = cv2.extractChannel(image, 3)
+    else:
+        # Convert the image to grayscale
+        grayscale_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
 
-    # Generate the mask
-    mask = np.where(grayscale_image > threshold, 255, 0)
+    # Generate the mask directly as uint8 in a single pass
+    _, mask = cv2.threshold(grayscale_image, threshold, 255, cv2.THRESH_BINARY)
 
-    return mask.astype(np.uint8)
\ No newline at end of file
+    return mask
\ No newline at end of file
@@ -1,5 +1,5 @@
 import numpy as np
-from object_detection.landmarks import adjust_for_roi_crop, transform_point
+from object_detection.landmarks import transform_points
 from object_detection.roi_extraction import extract_roi
 
 
@@ -25,15 +25,15 @@ def is_point_inside_rect(image: np.ndarray, point: tuple, rect: tuple) -> bool:
 
     (center, (width, height), theta) = rect
     roi, rotation_matrix = extract_roi(image, rect)
-    rotated_point = transform_point(point, rotation_matrix)
-    adjusted_point = adjust_for_roi_crop(rotated_point, rect[0], rect[1])
+    adjusted_point = transform_points([point], rotation_matrix)[0]
 
-    # Check if the adjusted point is within the rectangle's boundaries
+    # Check if the adjusted point is within the rectangle's boundaries, centered in the ROI
     half_width, half_height = width / 2, height / 2
-    return (-half_width <= adjusted_point[0] <= half_width) and (-half_height <= adjusted_point[1] <= half_height)
+    roi_cx, roi_cy = roi.shape[1] / 2, roi.shape[0] / 2
+    return (-half_width <= adjusted_point[0] - roi_cx <= half_width) and (-half_height <= adjusted_point[1] - roi_cy <= half_height)
 
 
-def process_neighbor_finger(this_pip: tuple, this_dip: tuple, neighbor_key: str, landmarks_per_finger: dict, landmark_pixels: list, rect: tuple, rgb_mask: np.ndarray, roi: np.ndarray, used_fingers: list) -> np.ndarray:
+def process_neighbor_finger(this_pip: tuple, this_dip: tuple, neighbor_key: str, landmarks_per_finger: dict, landmark_pixels: np.ndarray, rect: tuple, rgb_mask: np.ndarray, roi: np.ndarray, used_fingers: list) -> np.ndarray:
     """
     Processes the neighboring finger and adjusts the ROI if necessary.
 
@@ -42,7 +42,7 @@ def process_neighbor_finger(this_pip: tuple, this_dip: tuple, neighbor_key: str,
         this_dip (tuple): The (x, y) coordinates of the DIP joint of the current finger.
         neighbor_key (str): The key identifying the neighboring finger.
         landmarks_per_finger (dict): A dictionary mapping fingers to their respective landmarks.
-        landmark_pixels (list): Pixel coordinates of the landmarks.
+        landmark_pixels (np.ndarray): Pixel coordinates of the landmarks.
         rect (tuple): A tuple describing the rectangle, containing the center, size, and rotation angle.
         rgb_mask (np.ndarray): The RGB mask of the image.
         roi (np.ndarray): The region of interest in the image.
@@ -51,8 +51,8 @@ def process_neighbor_finger(this_pip: tuple, this_dip: tuple, neighbor_key: str,
     Returns:
         np.ndarray: The adjusted ROI if the neighboring finger is relevant, or the original ROI.
     """
-    neighbor_pip = np.array(landmark_pixels[landmarks_per_finger[neighbor_key][1]])
-    neighbor_dip = np.array(landmark_pixels[landmarks_per_finger[neighbor_key][2]])
+    neighbor_pip = landmark_pixels[landmarks_per_finger[neighbor_key][1]]
+    neighbor_dip = landmark_pixels[landmarks_per_finger[neighbor_key][2]]
 
     if is_point_inside_rect(rgb_mask, neighbor_dip, rect) or is_point_inside_rect(rgb_mask, neighbor_pip, rect):
         used_fingers.append(neighbor_key)
@@ -76,8 +76,8 @@ def adjust_roi_for_neighbor(this_pip: tuple, this_dip: tuple, neighbor_pip: tupl
         np.ndarray: The adjusted ROI based on the positions of the PIP and DIP joints.
     """
     # Transform the neighbor landmarks
-    transformed_neighbor_pip = transform_point(neighbor_pip, rect[1])
-    transformed_neighbor_dip = transform_point(neighbor_dip, rect[2])
+    transformed_neighbor_pip = transform_points([neighbor_pip], rect[1])[0]
+    transformed_neighbor_dip = transform_points([neighbor_dip], rect[2])[0]
 
     # Compute middle points and adjust ROI
     pip_middle = (this_pip + transformed_neighbor_pip) // 2
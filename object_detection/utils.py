@@ -1,4 +1,6 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 import cv2
 import numpy as np
 import mediapipe as mp
@@ -11,6 +13,19 @@ FONT_SIZE = 1
 FONT_THICKNESS = 1
 HANDEDNESS_TEXT_COLOR = (88, 205, 54)  # vibrant green
 
+# HandLandmarker instances keyed by model path, created once and reused across images
+_LANDMARKERS = {}
+# A HandLandmarker instance is not safe to call from several threads at once
+_LANDMARKER_LOCK = threading.Lock()
+
+# Image encoding and disk writes run in the background, off the processing path
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
+# Writes still in flight and errors of finished writes, both removed once reported
+_PENDING_WRITES = set()
+_WRITE_ERRORS = []
+_WRITES_LOCK = threading.Lock()
+PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
 
 def resize_image(img: np.ndarray, new_size: int) -> np.ndarray:
     """
@@ -41,6 +56,54 @@ def resize_image(img: np.ndarray, new_size: int) -> np.ndarray:
     return cv2.resize(img, dim, interpolation=cv2.INTER_AREA)
 
 
+def resize_longest_edge_to_target(img: np.ndarray, target: int) -> np.ndarray:
+    """
+    Resizes an image by resizing the longest axis to the desired size while maintaining the aspect ratio.
+
+    Args:
+        img (np.ndarray): The image to be resized.
+        target (int): The new size of the longest axis of the image.
+
+    Returns:
+        np.ndarray: The resized image.
+
+    Raises:
+        None
+
+    Test Case:
+        >>> img = np.zeros((3000, 4000, 3), dtype=np.uint8)
+        >>> resized_img = resize_longest_edge_to_target(img, 512)
+        >>> resized_img.shape
+        (384, 512, 3)
+    """
+    scale_percent = target / max((img.shape[0], img.shape[1]))
+    width = int(img.shape[1] * scale_percent)
+    height = int(img.shape[0] * scale_percent)
+
+    dim = (width, height)
+    return cv2.resize(img, dim, interpolation=cv2.INTER_AREA)
+
+
+def get_landmarker(detector_path: str) -> vision.HandLandmarker:
+    """
+    Returns a cached HandLandmarker for the given model, creating it on first use.
+
+    Args:
+        detector_path (str): The file path of the HandLandmarker model.
+
+    Returns:
+        vision.HandLandmarker: The HandLandmarker object loaded from the model file.
+    """
+    with _LANDMARKER_LOCK:
+        if detector_path not in _LANDMARKERS:
+            base_options = python.BaseOptions(model_asset_path=detector_path)
+            options = vision.HandLandmarkerOptions(base_options=base_options,
+                                                   num_hands = 2,
+                                                   min_hand_detection_confidence=0.01)
+            _LANDMARKERS[detector_path] = vision.HandLandmarker.create_from_options(options)
+        return _LANDMARKERS[detector_path]
+
+
 def locate_hand_landmarks(image_path: str, detector_path: str) -> vision.HandLandmarkerResult:
     """
     Detects hand landmarks in the input image using the specified HandLandmarker object.
@@ -50,7 +113,8 @@ def locate_hand_landmarks(image_path: str, detector_path: str) -> vision.HandLan
         detector_path (str): The file path of the HandLandmarker model.
 
     Returns:
-        vision.HandLandmarkerResult: The result of the hand landmark detection, which includes the detected landmarks and their confidence scores.
+        tuple: The decoded RGB image as a read-only array and the vision.HandLandmarkerResult of the hand landmark detection,
+        which includes the detected landmarks and their confidence scores.
 
     Raises:
         None
@@ -58,17 +122,15 @@ def locate_hand_landmarks(image_path: str, detector_path: str) -> vision.HandLan
     Test Case:
         # This function requires specific input files and a HandLandmarker object, hence a practical test would involve using actual files.
     """
-    base_options = python.BaseOptions(model_asset_path=detector_path)
-
-    options = vision.HandLandmarkerOptions(base_options=base_options,
-                                           num_hands = 2,
-                                           min_hand_detection_confidence=0.01)
-    detector = vision.HandLandmarker.create_from_options(options)
-    # Convert the input image to a mediapipe image
+    detector = get_landmarker(detector_path)
+    # Decode the input image straight to RGB as a mediapipe image
     mediapipe_image = mp.Image.create_from_file(image_path)
 
-    # Use the HandLandmarker object to detect hand landmarks in the mediapipe image
-    return mediapipe_image.numpy_view().astype(np.uint8), detector.detect(mediapipe_image)
+    # Use the HandLandmarker object to detect hand landmarks in the mediapipe image.
+    # The decoded pixels are shared with the caller instead of being copied.
+    with _LANDMARKER_LOCK:
+        result = detector.detect(mediapipe_image)
+    return mediapipe_image.numpy_view(), result
 
 
 def draw_landmarks_on_image(rgb_image: np.ndarray, detection_result: vision.HandLandmarkerResult) -> np.ndarray:
@@ -169,6 +231,101 @@ def save_roi_image(roi, path):
         None
     """
     if roi.size > 0 and roi is not None:
-        cv2.imwrite(path, roi)
+        write_image_async(path, roi)
     else:
-        print(f"Warning: The ROI image is empty or None. Skipping save operation for finger {os.path.basename(path)}.")
\ No newline at end of file
+        print(f"Warning: The ROI image is empty or None. Skipping save operation for finger {os.path.basename(path)}.")
+
+
+def _write_image(path, image):
+    """
+    Writes an image to the specified path, raising an error if OpenCV could not write it.
+
+    Args:
+        path (str): The file path where the image will be saved.
+        image (np.ndarray): The image to be saved.
+
+    Returns:
+        None
+
+    Raises:
+        IOError: If the image could not be encoded or written.
+    """
+    if not cv2.imwrite(path, image, PNG_WRITE_PARAMS):
+        raise IOError("Could not write image to {}.".format(path))
+
+
+def _on_write_done(future):
+    """
+    Forgets a finished write and records its error, if any.
+
+    Args:
+        future (Future): The finished write.
+
+    Returns:
+        None
+    """
+    with _WRITES_LOCK:
+        _PENDING_WRITES.discard(future)
+        if future.exception() is not None:
+            _WRITE_ERRORS.append(future.exception())
+
+
+def write_image_async(path, image):
+    """
+    Queues an image to be written to the specified path on a background thread.
+
+    The image is copied so the caller can keep modifying its buffer. PNG files are written
+    with a low compression level to keep encoding fast.
+
+    Args:
+        path (str): The file path where the image will be saved.
+        image (np.ndarray): The image to be saved.
+
+    Returns:
+        None
+    """
+    future = _IO_POOL.submit(_write_image, path, image.copy())
+    with _WRITES_LOCK:
+        _PENDING_WRITES.add(future)
+    future.add_done_callback(_on_write_done)
+
+
+def wait_for_pending_writes():
+    """
+    Blocks until all images queued with `write_image_async` have been written.
+
+    Returns:
+        None
+
+    Raises:
+        IOError: The first error raised by a write since the last call, if any write failed.
+    """
+    with _WRITES_LOCK:
+        pending = list(_PENDING_WRITES)
+    wait(pending)
+
+    with _WRITES_LOCK:
+        errors = _WRITE_ERRORS[:]
+        _WRITE_ERRORS.clear()
+    if errors:
+        for error in errors[1:]:
+            print(f"Warning: {error}")
+        raise errors[0]
+
+
+def shutdown_image_writes():
+    """
+    Waits for all queued images to be written and shuts down the background writer.
+
+    Call this once at the end of the process, no images can be queued afterwards.
+
+    Returns:
+        None
+
+    Raises:
+        IOError: The first error raised by a write, if any write failed.
+    """
+    try:
+        wait_for_pending_writes()
+    finally:
+        _IO_POOL.shutdown(wait=True)
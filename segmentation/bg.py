@@ -161,13 +161,19 @@ def naive_cutout(img, mask):
     return cutout
 
 
+# Loaded models keyed by name, so the weights are read from disk only once per process
+_MODELS = {}
+
+
 def get_model(model_name):
-    if model_name == "u2netp":
-        return detect.load_model(model_name="u2netp")
-    if model_name == "u2net_human_seg":
-        return detect.load_model(model_name="u2net_human_seg")
-    else:
-        return detect.load_model(model_name="u2net")
+    if model_name not in _MODELS:
+        if model_name == "u2netp":
+            _MODELS[model_name] = detect.load_model(model_name="u2netp")
+        elif model_name == "u2net_human_seg":
+            _MODELS[model_name] = detect.load_model(model_name="u2net_human_seg")
+        else:
+            _MODELS[model_name] = detect.load_model(model_name="u2net")
+    return _MODELS[model_name]
 
 
 import numpy as np
@@ -182,8 +188,9 @@ def remove(
     alpha_matting_base_size=1000,
 ):
     model = get_model(model_name)
-    img = Image.fromarray(data.astype('uint8'), 'RGB')
-    mask = detect.predict(model, np.array(img)).convert("L")
+    data = data.astype(np.uint8, copy=False)
+    img = Image.fromarray(data, 'RGB')
+    mask = detect.predict(model, data).convert("L")
 
     if alpha_matting:
         cutout = alpha_matting_cutout(